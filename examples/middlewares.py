@@ -19,7 +19,7 @@ class ExceptionHandlingMiddleware:
     ) -> Optional[HttpResponse]:
         if isinstance(exception, django.core.exceptions.ObjectDoesNotExist):
             return JsonResponse({"error": "Object does not exist"}, status=404)
-        if isinstance(exception, django.core.exceptions.ValidationError):
-            return JsonResponse({"error": exception.message_dict}, status=400)
+        if isinstance(exception, django.db.IntegrityError):
+            return JsonResponse({"error": "Integrity constraint violated"}, status=400)
         elif isinstance(exception, pydantic.ValidationError):
             return JsonResponse({"error": exception.errors()}, status=400)
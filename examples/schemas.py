@@ -9,7 +9,7 @@ class DepartmentQuery(BaseModel):
 
 
 class DepartmentIn(BaseModel):
-    title: str
+    title: str = Field(min_length=1, max_length=100)
 
 
 class DepartmentOut(BaseModel):
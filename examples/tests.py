@@ -1,5 +1,5 @@
 import uuid
-from typing import List
+from typing import Any, Dict, List
 
 from examples.models import Department
 from examples.schemas import DepartmentOut
@@ -9,11 +9,21 @@ from rest_testing import APITestCase, APIViewTestScenario
 class TestDepartmentViewSet(APITestCase):
     department_1: Department
     department_2: Department
+    department_1_out: Dict[str, Any]
+    department_2_out: Dict[str, Any]
 
     @classmethod
     def setUpTestData(cls):
         cls.department_1 = Department.objects.create(title="department-1")
         cls.department_2 = Department.objects.create(title="department-2")
+        cls.department_1_out = {
+            "id": str(cls.department_1.id),
+            "title": cls.department_1.title,
+        }
+        cls.department_2_out = {
+            "id": str(cls.department_2.id),
+            "title": cls.department_2.title,
+        }
 
     def test_list_departments(self):
         self.assertScenariosSucceed(
@@ -25,14 +35,8 @@ class TestDepartmentViewSet(APITestCase):
                     expected_response_status=200,
                     expected_response_body_type=List[DepartmentOut],
                     expected_response_body=[
-                        {
-                            "id": str(self.department_1.id),
-                            "title": self.department_1.title,
-                        },
-                        {
-                            "id": str(self.department_2.id),
-                            "title": self.department_2.title,
-                        },
+                        self.department_1_out,
+                        self.department_2_out,
                     ],
                 ),
             ],
@@ -51,6 +55,11 @@ class TestDepartmentViewSet(APITestCase):
                 APIViewTestScenario(
                     request_body={"title": "department-1"},
                     expected_response_status=400,
+                    expected_response_body={"error": "Integrity constraint violated"},
+                ),
+                APIViewTestScenario(
+                    request_body={"title": ""},
+                    expected_response_status=400,
                 ),
                 APIViewTestScenario(
                     request_body={"title": [1]},
@@ -68,10 +77,7 @@ class TestDepartmentViewSet(APITestCase):
                     path_parameters={"id": self.department_1.id},
                     expected_response_status=200,
                     expected_response_body_type=DepartmentOut,
-                    expected_response_body={
-                        "id": str(self.department_1.id),
-                        "title": self.department_1.title,
-                    },
+                    expected_response_body=self.department_1_out,
                 ),
                 APIViewTestScenario(
                     path_parameters={"id": uuid.uuid4()},
@@ -91,7 +97,7 @@ class TestDepartmentViewSet(APITestCase):
                     expected_response_status=200,
                     expected_response_body_type=DepartmentOut,
                     expected_response_body={
-                        "id": str(self.department_1.id),
+                        **self.department_1_out,
                         "title": "new_title",
                     },
                 ),
@@ -0,0 +1,71 @@
+import json
+import re
+import uuid
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# orjson only handles integers from the signed 64-bit minimum to the unsigned 64-bit
+# maximum: it refuses to serialize others and silently deserializes them as floats.
+# Payloads containing runs of 19 digits or more, which covers both bounds, are
+# handed to the standard library instead.
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+if orjson is not None:
+    # Types the standard library cannot serialize are passed through so that they
+    # fail with the same error, whichever backend is installed.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _default(obj: Any) -> Any:
+    # orjson serializes UUIDs natively, and there is no option to opt out of it.
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> Union[bytes, str]:
+    """
+    Serialize `obj` to JSON, using `orjson` when it is installed and falling back to
+    the standard library `json` module otherwise, or when `orjson` cannot serialize
+    `obj` the way `json` does (e.g. integers beyond 64 bits, or non-finite floats).
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN and infinities as `null` where `json` writes `NaN`
+            # and `Infinity`; any `null` may stand for one of them.
+            if b"null" not in data:
+                return data
+    return json.dumps(obj, default=_default)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON `data` to a Python object, using `orjson` when it is installed
+    and falling back to the standard library `json` module otherwise, or when `data`
+    may hold integers beyond 64 bits or non-finite floats, which `orjson` rejects.
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            has_long_digits = _LONG_DIGITS_STR.search(data) is not None
+        else:
+            has_long_digits = _LONG_DIGITS_BYTES.search(data) is not None
+        if not has_long_digits:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
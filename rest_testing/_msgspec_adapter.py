@@ -0,0 +1,154 @@
+import enum
+import functools
+import sys
+import types
+import uuid
+from typing import (
+    Any,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, RootModel
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+# Only configuration keys that cannot make Pydantic stricter than msgspec are
+# allowed; anything else (e.g. `str_max_length`, `strict`) disables the mirror.
+_ALLOWED_CONFIG_KEYS = frozenset({"extra", "title", "frozen"})
+
+# Leaf types that msgspec decodes from JSON no more leniently than Pydantic does.
+_ALLOWED_LEAF_TYPES = (str, int, float, bool, type(None), uuid.UUID)
+
+_ALLOWED_ORIGINS = {list, tuple, dict, set, frozenset, Union, Literal}
+if sys.version_info >= (3, 10):  # pragma: no cover
+    _ALLOWED_ORIGINS.add(types.UnionType)
+
+
+def _is_allowed_annotation(annotation: Any) -> bool:
+    if annotation is Ellipsis:
+        return True
+    if isinstance(annotation, type):
+        return annotation in _ALLOWED_LEAF_TYPES or issubclass(annotation, enum.Enum)
+
+    origin = get_origin(annotation)
+    if origin not in _ALLOWED_ORIGINS:
+        return False
+    if origin is Literal:
+        return True
+    return all(_is_allowed_annotation(arg) for arg in get_args(annotation))
+
+
+def _is_allowed_model(model: Any) -> bool:
+    if not isinstance(model, type) or not issubclass(model, BaseModel):
+        return False
+    if issubclass(model, RootModel):
+        return False
+
+    # Hooks that let a model reject payloads outside of its fields' annotations.
+    if model.model_post_init is not BaseModel.model_post_init:
+        return False
+    if getattr(model.__get_pydantic_core_schema__, "__func__", None) is not getattr(
+        BaseModel.__get_pydantic_core_schema__, "__func__", None
+    ):
+        return False
+
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return False
+    if not _ALLOWED_CONFIG_KEYS.issuperset(model.model_config):
+        return False
+
+    return all(
+        field.alias is None
+        and field.validation_alias is None
+        and not field.metadata
+        and not field.validate_default
+        and _is_allowed_annotation(field.annotation)
+        for field in model.model_fields.values()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_decoder(model: Hashable) -> Optional["msgspec.json.Decoder[Any]"]:
+    """
+    Build a msgspec JSON decoder for a `msgspec.Struct` mirroring the fields of the
+    given Pydantic model.
+
+    Returns `None` when msgspec is not installed, or when the model is not built
+    from an explicit allowlist of features: no root models, validators, aliases,
+    field constraints, `model_post_init` or core schema overrides, only a few
+    configuration keys, and only basic field types. The mirror must never accept a
+    payload that Pydantic would reject.
+    """
+    if msgspec is None:  # pragma: no cover
+        return None
+    if not _is_allowed_model(model):
+        return None
+    model = cast(Type[BaseModel], model)
+
+    fields: List[Tuple[Any, ...]] = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            fields.append((name, field.annotation))
+        elif field.default_factory is not None:
+            fields.append(
+                (
+                    name,
+                    field.annotation,
+                    msgspec.field(default_factory=field.default_factory),
+                )
+            )
+        else:
+            fields.append((name, field.annotation, field.default))
+
+    try:
+        struct = msgspec.defstruct(
+            model.__name__,
+            fields,
+            kw_only=True,
+            forbid_unknown_fields=model.model_config.get("extra") == "forbid",
+        )
+        return msgspec.json.Decoder(struct)
+    except TypeError:
+        return None
+
+
+def is_valid_json(type_: Any, data: bytes) -> bool:
+    """
+    Check whether `data` is valid JSON for the given type using msgspec.
+
+    A `False` result is not conclusive: it means either that the type has no msgspec
+    mirror or that msgspec rejected the payload, and the caller should fall back to
+    Pydantic validation to get the authoritative result and error message.
+    """
+    try:
+        decoder = _get_decoder(type_)
+    except TypeError:
+        # Unhashable types, e.g. `Annotated` with a dict as metadata, are not cached
+        # and have no mirror.
+        return False
+    if decoder is None:
+        return False
+    try:
+        decoder.decode(data)
+    except msgspec.DecodeError:
+        return False
+    return True
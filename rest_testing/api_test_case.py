@@ -1,17 +1,87 @@
-import json
-from typing import Any, Callable, Dict, List, Optional, cast
+import contextlib
+import functools
+import types
+import unittest
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
 
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
 from django.http.response import HttpResponse
 from django.test import TestCase
+from django.utils.datastructures import MultiValueDict
 from django.utils.http import urlencode
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 
+from rest_testing import _json, _msgspec_adapter
 from rest_testing.api_view_test_scenario import (
+    INVALID_JSON_BODY,
+    JSON_BODY,
+    RAW_BODY,
     APIViewTestScenario,
     ResponseBodyType,
 )
 
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_EMPTY_MAPPING: Mapping[str, Any] = types.MappingProxyType({})
+
+
+def _encode_query_string(query_parameters: Mapping[str, Any]) -> str:
+    if not query_parameters:
+        return ""
+    # The stdlib urlencode is only used for plain strings and lists or tuples of
+    # strings, which both encode identically. Django's urlencode is kept for
+    # everything else: it expands every value of a MultiValueDict, iterates
+    # generators and rejects None values with a helpful error.
+    if isinstance(query_parameters, MultiValueDict) or not all(
+        _is_simple_query_value(value) for value in query_parameters.values()
+    ):
+        return urlencode(query_parameters, doseq=True)
+    return urllib.parse.urlencode(query_parameters, doseq=True)
+
+
+def _is_simple_query_value(value: Any) -> bool:
+    if isinstance(value, (str, bytes)):
+        return True
+    return isinstance(value, (list, tuple)) and all(
+        isinstance(item, (str, bytes)) for item in value
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_type_adapter(type_: Hashable) -> TypeAdapter[Any]:
+    return TypeAdapter(type_)
+
+
+def _get_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    try:
+        return _get_cached_type_adapter(type_)
+    except TypeError:
+        # Valid types may still be unhashable, e.g. `Annotated` with a dict as
+        # metadata; those get a fresh adapter every time.
+        return TypeAdapter(type_)
+
+
+def _validate_json(type_: Any, data: bytes) -> None:
+    # Models validate directly through their own compiled validator, without the
+    # TypeAdapter wrapper that other types such as `List[Model]` need.
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        type_.model_validate_json(data)
+    else:
+        _get_type_adapter(type_).validate_json(data)
+
 
 class APITestCase(TestCase):
     """
@@ -68,9 +138,16 @@ class APITestCase(TestCase):
         When testing multiple scenarios, each scenario is run in a subtest and in a
         separate transaction savepoint to ensure that the scenarios are independent.
         The database changes are rolled back between each scenario to prevent side
-        effects between scenarios.
+        effects between scenarios. Scenarios sent with a safe method (`GET`, `HEAD`,
+        `OPTIONS`) are not expected to change the database and skip the savepoint.
+
+        Set `aggregate_scenario_failures` to `True` on a subclass to run scenarios
+        without subtests: failures are then collected and reported together in a
+        single assertion error once all scenarios have run.
     """
 
+    aggregate_scenario_failures: bool = False
+
     def send_request(
         self,
         method: str,
@@ -107,18 +184,22 @@ class APITestCase(TestCase):
         )
         ```
         """
-        args: Dict[str, Any] = {
+        if "{" in path:
+            path = path.format_map(path_parameters or _EMPTY_MAPPING)
+
+        # Request headers are merged last so that they can override any of the
+        # computed arguments, including the query string.
+        kwargs: Dict[str, Any] = {
             "method": method,
-            "path": path.format(**path_parameters or {}),
+            "path": path,
+            "data": "" if request_body is None else _json.dumps(request_body),
         }
         if query_parameters is not None:
-            args["QUERY_STRING"] = urlencode(query_parameters, doseq=True)
-        if request_body is not None:
-            args["data"] = json.dumps(request_body)
+            kwargs["QUERY_STRING"] = _encode_query_string(query_parameters)
         if request_headers is not None:
-            args.update(request_headers)
+            kwargs.update(request_headers)
 
-        response = self.client.generic(**args)
+        response = self.client.generic(**kwargs)
         return cast(HttpResponse, response)
 
     def assertScenarioSucceed(
@@ -155,7 +236,20 @@ class APITestCase(TestCase):
         )
         ```
         """
-        response = self.send_request(
+        response = self._send_scenario_request(
+            method=method, path=path, scenario=scenario
+        )
+        self._assertScenarioResponse(
+            response=response, scenario=scenario, default_assertions=default_assertions
+        )
+
+    def _send_scenario_request(
+        self,
+        method: str,
+        path: str,
+        scenario: APIViewTestScenario[ResponseBodyType],
+    ) -> HttpResponse:
+        return self.send_request(
             method=method,
             path=path,
             path_parameters=scenario.path_parameters,
@@ -164,24 +258,48 @@ class APITestCase(TestCase):
             request_headers=scenario.request_headers,
         )
 
+    def _assertScenarioResponse(
+        self,
+        response: HttpResponse,
+        scenario: APIViewTestScenario[ResponseBodyType],
+        default_assertions: Optional[
+            Callable[[HttpResponse, APIViewTestScenario[ResponseBodyType]], None]
+        ] = None,
+    ) -> None:
         if scenario.expected_response_status is not None:
             self.assertEqual(
                 first=response.status_code, second=scenario.expected_response_status
             )
 
-        if scenario.expected_response_body_type is not None:
-            TypeAdapter(scenario.expected_response_body_type).validate_json(
-                response.content
-            )
+        expected_response_body_type = scenario.expected_response_body_type
+        if expected_response_body_type is not None:
+            # The type is always checked against the raw JSON, since Pydantic's JSON
+            # mode is laxer than its Python mode for strict UUID or datetime fields.
+            # msgspec may only confirm validity; Pydantic stays the source of truth
+            # for failures and for types that msgspec cannot mirror.
+            if not _msgspec_adapter.is_valid_json(
+                expected_response_body_type, response.content
+            ):
+                _validate_json(expected_response_body_type, response.content)
+
+        expected_response_body_kind = scenario._expected_response_body_kind
+        if expected_response_body_kind == JSON_BODY:
+            try:
+                response_body = _json.loads(response.content)
+            except ValueError:
+                self.fail(f"Response body is not valid JSON: {response.content!r}")
 
-        if isinstance(scenario.expected_response_body, bytes):
+            self.assertEqual(
+                first=response_body, second=scenario._parsed_expected_response_body
+            )
+        elif expected_response_body_kind == RAW_BODY:
             self.assertEqual(
                 first=response.content, second=scenario.expected_response_body
             )
-        elif scenario.expected_response_body is not None:
-            self.assertJSONEqual(
-                raw=response.content.decode(),
-                expected_data=scenario.expected_response_body,
+        elif expected_response_body_kind == INVALID_JSON_BODY:
+            self.fail(
+                "Expected response body is not valid JSON: "
+                f"{scenario.expected_response_body!r}"
             )
 
         assertions = scenario.assertions or default_assertions
@@ -196,6 +314,8 @@ class APITestCase(TestCase):
         default_assertions: Optional[
             Callable[[HttpResponse, APIViewTestScenario[ResponseBodyType]], None]
         ] = None,
+        isolate_scenarios: bool = True,
+        parallel: int = 1,
     ) -> None:
         """
         Assert that the given scenarios succeed when sent to the API view with the
@@ -203,7 +323,8 @@ class APITestCase(TestCase):
 
         This method runs each scenario in a separate transaction savepoint to ensure
         that the scenarios are independent, and rolls back the database changes between
-        each scenario.
+        each scenario. Savepoints are skipped for safe methods (`GET`, `HEAD`,
+        `OPTIONS`), or altogether when `isolate_scenarios` is `False`.
 
         Args:
             method (str): The HTTP method of the request.
@@ -211,6 +332,16 @@ class APITestCase(TestCase):
             scenarios (List[APIViewTestScenario]): The scenarios to test.
             default_assertions (Optional[Callable], optional): The default assertions
                 to make on the response if no assertions are provided in the scenarios.
+            isolate_scenarios (bool, optional): Whether to run each scenario in a
+                separate transaction savepoint. Set to `False` when the scenarios are
+                known to be independent of each other's side effects. Defaults to `True`.
+            parallel (int, optional): The number of threads used to send the requests
+                of scenarios with a safe method (`GET`, `HEAD`, `OPTIONS`) concurrently.
+                Assertions are still made sequentially once all responses are received.
+                Only supported when every database of the test is an in-memory SQLite
+                database; scenarios are sent sequentially otherwise. Since Django's
+                test client reports unhandled view exceptions through a global signal,
+                such an exception may surface in another scenario. Defaults to `1`.
 
         Example:
         ```python
@@ -237,15 +368,136 @@ class APITestCase(TestCase):
         )
         ```
         """
+        is_safe_method = method.upper() in SAFE_METHODS
+        if parallel > 1 and is_safe_method and self._uses_in_memory_sqlite_only():
+            self._assertScenariosSucceedInParallel(
+                method=method,
+                path=path,
+                scenarios=scenarios,
+                default_assertions=default_assertions,
+                parallel=parallel,
+            )
+            return
+
+        use_savepoints = isolate_scenarios and not is_safe_method
+        failures = self._new_scenario_failures()
+        # Bound methods are resolved once rather than on every scenario, while still
+        # honoring overrides of these methods in subclasses.
+        scenario_context = self._scenario_context
+        assert_scenario_succeed = self.assertScenarioSucceed
         for scenario in scenarios:
-            with self.subTest(scenario):
-                sid = transaction.savepoint()
+            with scenario_context(scenario, failures):
+                sid = transaction.savepoint() if use_savepoints else None
                 try:
-                    self.assertScenarioSucceed(
+                    assert_scenario_succeed(
                         method=method,
                         path=path,
                         scenario=scenario,
                         default_assertions=default_assertions,
                     )
                 finally:
-                    transaction.savepoint_rollback(sid)
+                    if sid is not None:
+                        transaction.savepoint_rollback(sid)
+        self._raise_scenario_failures(failures, scenarios)
+
+    def _uses_in_memory_sqlite_only(self) -> bool:
+        for alias in self.databases:
+            connection = connections[alias]
+            if not isinstance(connection, SQLiteDatabaseWrapper):
+                return False
+            if not connection.is_in_memory_db():
+                return False
+        return True
+
+    def _assertScenariosSucceedInParallel(
+        self,
+        method: str,
+        path: str,
+        scenarios: List[APIViewTestScenario[ResponseBodyType]],
+        default_assertions: Optional[
+            Callable[[HttpResponse, APIViewTestScenario[ResponseBodyType]], None]
+        ],
+        parallel: int,
+    ) -> None:
+        # Worker threads reuse the test's in-memory SQLite connections so that they
+        # see the data of the test transaction, which is never committed. Other
+        # backends are excluded: a connection closed by one thread inside the test's
+        # atomic block could mark the whole test transaction for rollback.
+        shared_connections = {alias: connections[alias] for alias in self.databases}
+
+        def share_connections() -> None:
+            for alias, connection in shared_connections.items():
+                connections[alias] = connection
+
+        for connection in shared_connections.values():
+            connection.inc_thread_sharing()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=parallel, initializer=share_connections
+            ) as executor:
+                send_scenario_request = self._send_scenario_request
+                futures = [
+                    executor.submit(
+                        send_scenario_request,
+                        method=method,
+                        path=path,
+                        scenario=scenario,
+                    )
+                    for scenario in scenarios
+                ]
+        finally:
+            for connection in shared_connections.values():
+                connection.dec_thread_sharing()
+
+        # Assertions run in the main thread so that subtests are reported correctly.
+        failures = self._new_scenario_failures()
+        scenario_context = self._scenario_context
+        assert_scenario_response = self._assertScenarioResponse
+        for scenario, future in zip(scenarios, futures):
+            with scenario_context(scenario, failures):
+                assert_scenario_response(
+                    response=future.result(),
+                    scenario=scenario,
+                    default_assertions=default_assertions,
+                )
+        self._raise_scenario_failures(failures, scenarios)
+
+    def _new_scenario_failures(
+        self,
+    ) -> Optional[List[Tuple[APIViewTestScenario[Any], Exception]]]:
+        return [] if self.aggregate_scenario_failures else None
+
+    @contextlib.contextmanager
+    def _scenario_context(
+        self,
+        scenario: APIViewTestScenario[Any],
+        failures: Optional[List[Tuple[APIViewTestScenario[Any], Exception]]],
+    ) -> Iterator[None]:
+        if failures is None:
+            with self.subTest(scenario):
+                yield
+            return
+
+        try:
+            yield
+        except unittest.SkipTest:
+            raise
+        except Exception as exception:
+            failures.append((scenario, exception))
+
+    def _raise_scenario_failures(
+        self,
+        failures: Optional[List[Tuple[APIViewTestScenario[Any], Exception]]],
+        scenarios: List[APIViewTestScenario[ResponseBodyType]],
+    ) -> None:
+        if not failures:
+            return
+
+        messages = [
+            f"{scenario}\n{type(exception).__name__}: {exception}"
+            for scenario, exception in failures
+        ]
+        raise self.failureException(
+            f"{len(failures)} of {len(scenarios)} scenarios failed:\n\n"
+            + "\n\n".join(messages)
+        )
@@ -2,8 +2,16 @@ from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
 
 from django.http import HttpResponse
 
+from rest_testing import _json
+
 ResponseBodyType = TypeVar("ResponseBodyType")
 
+# Kinds of expected response body, resolved once per scenario.
+NO_BODY = 0
+RAW_BODY = 1
+JSON_BODY = 2
+INVALID_JSON_BODY = 3
+
 
 class APIViewTestScenario(Generic[ResponseBodyType]):
     """
@@ -45,6 +53,19 @@ class APIViewTestScenario(Generic[ResponseBodyType]):
         type using Pydantic's [TypeAdapter](https://docs.pydantic.dev/latest/api/type_adapter/#pydantic.type_adapter.TypeAdapter).
     """
 
+    # Public fields, in the order in which `__str__` lists them.
+    _FIELDS = (
+        "description",
+        "path_parameters",
+        "query_parameters",
+        "request_body",
+        "request_headers",
+        "expected_response_status",
+        "expected_response_body_type",
+        "expected_response_body",
+        "assertions",
+    )
+
     def __init__(
         self,
         description: Optional[str] = None,
@@ -69,9 +90,37 @@ class APIViewTestScenario(Generic[ResponseBodyType]):
         self.expected_response_body = expected_response_body
         self.assertions = assertions
 
+    @property
+    def expected_response_body(self) -> Optional[Any]:
+        return self._expected_response_body
+
+    @expected_response_body.setter
+    def expected_response_body(self, value: Optional[Any]) -> None:
+        # JSON strings are parsed once here rather than on every run of the scenario;
+        # raw bytes are compared as-is and therefore left untouched. Invalid JSON is
+        # only reported when the scenario is asserted, as a failure of the scenario.
+        self._expected_response_body = value
+        self._parsed_expected_response_body = value
+        if value is None:
+            self._expected_response_body_kind = NO_BODY
+        elif isinstance(value, (bytes, bytearray)):
+            self._expected_response_body_kind = RAW_BODY
+        else:
+            self._expected_response_body_kind = JSON_BODY
+            if isinstance(value, str):
+                try:
+                    self._parsed_expected_response_body = _json.loads(value)
+                except ValueError:
+                    self._expected_response_body_kind = INVALID_JSON_BODY
+
     def __str__(self) -> str:
-        lines = ["APIViewTestScenario:"]
-        for key, value in self.__dict__.items():
-            if value is not None:
-                lines.append(f"\t{key}={value}")
-        return "\n".join(lines)
+        return "\n".join(
+            [
+                "APIViewTestScenario:",
+                *[
+                    f"\t{key}={value}"
+                    for key in self._FIELDS
+                    if (value := getattr(self, key)) is not None
+                ],
+            ]
+        )
@@ -1,12 +1,27 @@
+import json
+import unittest
 import uuid
-from unittest.mock import Mock
+from typing import List
+from unittest.mock import ANY, Mock, patch
 
-from django.http import HttpResponse
+from django.db import connections
+from django.http import HttpResponse, QueryDict
+from django.utils.datastructures import MultiValueDict
+from pydantic import BaseModel, ConfigDict, ValidationError
+from typing_extensions import Annotated
 
+from examples.models import Department
 from examples.schemas import DepartmentOut
 from rest_testing.api_test_case import APITestCase, APIViewTestScenario
 
 
+class StrictDepartmentOut(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+    id: uuid.UUID
+    title: str
+
+
 class TestAPITestCase(APITestCase):
     def setUp(self):
         self.client = Mock()
@@ -24,9 +39,59 @@ class TestAPITestCase(APITestCase):
             method="POST",
             path="/api/departments/1",
             QUERY_STRING="",
-            data='{"title": "new title"}',
+            data=ANY,
             HTTP_AUTHORIZATION="Bearer 123",
         )
+        data = self.client.generic.call_args.kwargs["data"]
+        self.assertEqual(json.loads(data), {"title": "new title"})
+
+    def test_send_request_headers_override(self):
+        self.send_request(
+            method="GET",
+            path="/api/departments/",
+            query_parameters={"q": "a"},
+            request_headers={"QUERY_STRING": "q=b", "data": "raw", "path": "/api/"},
+        )
+        self.client.generic.assert_called_with(
+            method="GET", path="/api/", data="raw", QUERY_STRING="q=b"
+        )
+
+    def test_send_request_query_parameters(self):
+        self.send_request(
+            method="GET",
+            path="/api/departments/",
+            query_parameters={"order_by": ["title", "-id"], "q": "a b"},
+        )
+        self.client.generic.assert_called_with(
+            method="GET",
+            path="/api/departments/",
+            data="",
+            QUERY_STRING="order_by=title&order_by=-id&q=a+b",
+        )
+
+        with self.assertRaises(TypeError):
+            self.send_request(
+                method="GET", path="/api/departments/", query_parameters={"q": None}
+            )
+
+        for query_parameters, query_string in [
+            (MultiValueDict({"a": ["1", "2"]}), "a=1&a=2"),
+            (QueryDict("a=1&a=2"), "a=1&a=2"),
+            ({"a": (str(i) for i in range(2))}, "a=0&a=1"),
+            ({"a": 1, "b": [2, "3"]}, "a=1&b=2&b=3"),
+        ]:
+            with self.subTest(query_parameters=query_parameters):
+                self.send_request(
+                    method="GET",
+                    path="/api/departments/",
+                    query_parameters=query_parameters,
+                )
+                self.client.generic.assert_called_with(
+                    method="GET",
+                    path="/api/departments/",
+                    data="",
+                    QUERY_STRING=query_string,
+                )
 
     def test_assert_scenario_succeed(self):
         self.client.generic.return_value = Mock(
@@ -48,6 +113,38 @@ class TestAPITestCase(APITestCase):
             ),
         )
 
+        self.client.generic.return_value = Mock(
+            spec=HttpResponse,
+            status_code=200,
+            content=b'[{"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003", "title": "department-1"}]',
+        )
+        self.assertScenarioSucceed(
+            method="GET",
+            path="/api/departments/",
+            scenario=APIViewTestScenario(
+                expected_response_status=200,
+                expected_response_body_type=List[DepartmentOut],
+            ),
+        )
+
+        with self.assertRaises(ValidationError):
+            self.client.generic.return_value = Mock(
+                spec=HttpResponse,
+                status_code=200,
+                content=b'{"id": "invalid", "title": "department-1"}',
+            )
+            self.assertScenarioSucceed(
+                method="GET",
+                path="/api/departments/{id}",
+                scenario=APIViewTestScenario(
+                    path_parameters={
+                        "id": uuid.UUID("3b13b5f4-150d-494e-8649-ed6e3f58c003")
+                    },
+                    expected_response_status=200,
+                    expected_response_body_type=DepartmentOut,
+                ),
+            )
+
         with self.assertRaises(AssertionError):
             self.client.generic.return_value = Mock(spec=HttpResponse, status_code=404)
             self.assertScenarioSucceed(
@@ -59,3 +156,284 @@ class TestAPITestCase(APITestCase):
                     assertions=lambda response, scenario: None,
                 ),
             )
+
+    def test_assert_scenario_succeed_expected_response_body(self):
+        self.client.generic.return_value = Mock(
+            spec=HttpResponse,
+            status_code=200,
+            content=b'{"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003", "title": "department-1"}',
+        )
+
+        self.assertScenarioSucceed(
+            method="GET",
+            path="/api/departments/{id}",
+            scenario=APIViewTestScenario(
+                path_parameters={
+                    "id": uuid.UUID("3b13b5f4-150d-494e-8649-ed6e3f58c003")
+                },
+                expected_response_status=200,
+                expected_response_body='{"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003", "title": "department-1"}',
+            ),
+        )
+
+        with self.assertRaises(AssertionError):
+            self.client.generic.return_value = Mock(
+                spec=HttpResponse, status_code=200, content=b"not json"
+            )
+            self.assertScenarioSucceed(
+                method="GET",
+                path="/api/departments/{id}",
+                scenario=APIViewTestScenario(
+                    path_parameters={
+                        "id": uuid.UUID("3b13b5f4-150d-494e-8649-ed6e3f58c003")
+                    },
+                    expected_response_status=200,
+                    expected_response_body={"title": "department-1"},
+                ),
+            )
+
+    def test_assert_scenario_succeed_reassigned_expected_response_body(self):
+        self.client.generic.return_value = Mock(
+            spec=HttpResponse, status_code=200, content=b'{"id": 1}'
+        )
+        scenario = APIViewTestScenario(expected_response_body='{"id": 1}')
+        self.assertScenarioSucceed(
+            method="GET", path="/api/departments/", scenario=scenario
+        )
+
+        for expected_response_body in ['{"id": 2}', {"id": 2}, b"{}", "not json"]:
+            with self.subTest(expected_response_body=expected_response_body):
+                scenario.expected_response_body = expected_response_body
+                with self.assertRaises(AssertionError):
+                    self.assertScenarioSucceed(
+                        method="GET", path="/api/departments/", scenario=scenario
+                    )
+
+    def test_assert_scenarios_succeed_savepoints(self):
+        self.client.generic.return_value = Mock(spec=HttpResponse, status_code=200)
+        scenarios = [APIViewTestScenario(expected_response_status=200)]
+
+        with patch("rest_testing.api_test_case.transaction") as transaction:
+            self.assertScenariosSucceed(
+                method="POST", path="/api/departments/", scenarios=scenarios
+            )
+            transaction.savepoint.assert_called_once()
+            transaction.savepoint_rollback.assert_called_once()
+
+        with patch("rest_testing.api_test_case.transaction") as transaction:
+            self.assertScenariosSucceed(
+                method="GET", path="/api/departments/", scenarios=scenarios
+            )
+            self.assertScenariosSucceed(
+                method="POST",
+                path="/api/departments/",
+                scenarios=scenarios,
+                isolate_scenarios=False,
+            )
+            transaction.savepoint.assert_not_called()
+            transaction.savepoint_rollback.assert_not_called()
+
+    def test_assert_scenarios_succeed_parallel(self):
+        self.client.generic.return_value = Mock(spec=HttpResponse, status_code=200)
+        scenarios = [
+            APIViewTestScenario(expected_response_status=200),
+            APIViewTestScenario(expected_response_status=200),
+        ]
+
+        self.assertScenariosSucceed(
+            method="GET", path="/api/departments/", scenarios=scenarios, parallel=2
+        )
+        self.assertEqual(self.client.generic.call_count, 2)
+
+        for unsupported_db in [
+            patch.object(connections["default"], "is_in_memory_db", return_value=False),
+            patch(
+                "rest_testing.api_test_case.SQLiteDatabaseWrapper",
+                type("Other", (), {}),
+            ),
+        ]:
+            with unsupported_db, patch(
+                "rest_testing.api_test_case.ThreadPoolExecutor"
+            ) as executor:
+                self.assertScenariosSucceed(
+                    method="GET",
+                    path="/api/departments/",
+                    scenarios=scenarios,
+                    parallel=2,
+                )
+                executor.assert_not_called()
+        self.assertEqual(self.client.generic.call_count, 6)
+
+    def test_assert_scenarios_succeed_aggregate_failures(self):
+        self.aggregate_scenario_failures = True
+        self.client.generic.return_value = Mock(spec=HttpResponse, status_code=200)
+        scenarios = [
+            APIViewTestScenario(expected_response_status=200),
+            APIViewTestScenario(expected_response_status=404),
+        ]
+
+        self.assertScenariosSucceed(
+            method="GET", path="/api/departments/", scenarios=scenarios[:1]
+        )
+
+        for parallel in [1, 2]:
+            with self.subTest(parallel=parallel):
+                with self.assertRaisesRegex(
+                    AssertionError, "1 of 2 scenarios failed:\n\nAPIViewTestScenario:"
+                ):
+                    self.assertScenariosSucceed(
+                        method="GET",
+                        path="/api/departments/",
+                        scenarios=scenarios,
+                        parallel=parallel,
+                    )
+
+    def test_assert_scenarios_succeed_aggregate_failures_skip(self):
+        self.aggregate_scenario_failures = True
+        self.client.generic.return_value = Mock(spec=HttpResponse, status_code=200)
+
+        def skip(response, scenario):
+            self.skipTest("skipped")
+
+        with self.assertRaises(unittest.SkipTest):
+            self.assertScenariosSucceed(
+                method="GET",
+                path="/api/departments/",
+                scenarios=[APIViewTestScenario(assertions=skip)],
+            )
+
+    def test_assert_scenario_succeed_strict_type_with_expected_response_body(self):
+        self.client.generic.return_value = Mock(
+            spec=HttpResponse,
+            status_code=200,
+            content=b'{"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003", "title": "department-1"}',
+        )
+
+        self.assertScenarioSucceed(
+            method="GET",
+            path="/api/departments/{id}",
+            scenario=APIViewTestScenario(
+                path_parameters={
+                    "id": uuid.UUID("3b13b5f4-150d-494e-8649-ed6e3f58c003")
+                },
+                expected_response_status=200,
+                expected_response_body_type=StrictDepartmentOut,
+                expected_response_body={
+                    "id": "3b13b5f4-150d-494e-8649-ed6e3f58c003",
+                    "title": "department-1",
+                },
+            ),
+        )
+
+    def test_assert_scenario_succeed_unhashable_type(self):
+        self.client.generic.return_value = Mock(
+            spec=HttpResponse, status_code=200, content=b"[1, 2]"
+        )
+        expected_response_body_type = Annotated[List[int], {"doc": "ids"}]
+
+        self.assertScenarioSucceed(
+            method="GET",
+            path="/api/departments/",
+            scenario=APIViewTestScenario(
+                expected_response_body_type=expected_response_body_type,
+            ),
+        )
+
+        self.client.generic.return_value.content = b'["a"]'
+        with self.assertRaises(ValidationError):
+            self.assertScenarioSucceed(
+                method="GET",
+                path="/api/departments/",
+                scenario=APIViewTestScenario(
+                    expected_response_body_type=expected_response_body_type,
+                ),
+            )
+
+
+class TestAPITestCaseParallel(APITestCase):
+    department_1: Department
+    department_2: Department
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department_1 = Department.objects.create(title="department-1")
+        cls.department_2 = Department.objects.create(title="department-2")
+
+    def test_assert_scenarios_succeed_parallel(self):
+        department_1_out = {
+            "id": str(self.department_1.id),
+            "title": self.department_1.title,
+        }
+        department_2_out = {
+            "id": str(self.department_2.id),
+            "title": self.department_2.title,
+        }
+
+        self.assertScenariosSucceed(
+            method="GET",
+            path="/api/departments/",
+            scenarios=[
+                APIViewTestScenario(
+                    query_parameters={"order_by": [order_by]},
+                    expected_response_status=200,
+                    expected_response_body_type=List[DepartmentOut],
+                    expected_response_body=expected_response_body,
+                )
+                for order_by, expected_response_body in [
+                    ("title", [department_1_out, department_2_out]),
+                    ("-title", [department_2_out, department_1_out]),
+                ]
+                * 4
+            ],
+            parallel=4,
+        )
+        self.assertScenariosSucceed(
+            method="GET",
+            path="/api/departments/{id}",
+            scenarios=[
+                APIViewTestScenario(
+                    path_parameters={"id": self.department_1.id},
+                    expected_response_status=200,
+                    expected_response_body=department_1_out,
+                ),
+                APIViewTestScenario(
+                    path_parameters={"id": self.department_2.id},
+                    expected_response_status=200,
+                    expected_response_body=department_2_out,
+                ),
+                APIViewTestScenario(
+                    path_parameters={"id": uuid.uuid4()},
+                    expected_response_status=404,
+                ),
+            ]
+            * 4,
+            parallel=4,
+        )
+        self.assertEqual(Department.objects.count(), 2)
+
+    def test_assert_scenarios_succeed_parallel_unhandled_exception(self):
+        self.aggregate_scenario_failures = True
+
+        with self.assertLogs("django.request", level="ERROR"), self.assertRaisesRegex(
+            AssertionError, "FieldError"
+        ):
+            self.assertScenariosSucceed(
+                method="GET",
+                path="/api/departments/",
+                scenarios=[
+                    APIViewTestScenario(
+                        query_parameters={"order_by": ["title"]},
+                        expected_response_status=200,
+                    ),
+                    APIViewTestScenario(
+                        query_parameters={"order_by": ["unknown"]},
+                        expected_response_status=200,
+                    ),
+                    APIViewTestScenario(
+                        query_parameters={"order_by": ["-title"]},
+                        expected_response_status=200,
+                    ),
+                ],
+                parallel=3,
+            )
+        self.assertEqual(Department.objects.count(), 2)
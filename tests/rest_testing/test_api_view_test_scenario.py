@@ -1,6 +1,12 @@
 import unittest
 
 from rest_testing import APIViewTestScenario
+from rest_testing.api_view_test_scenario import (
+    INVALID_JSON_BODY,
+    JSON_BODY,
+    NO_BODY,
+    RAW_BODY,
+)
 
 
 class APIViewTestScenarioTest(unittest.TestCase):
@@ -27,3 +33,41 @@ class APIViewTestScenarioTest(unittest.TestCase):
             "\texpected_response_body={'id': 1, 'name': 'Test'}"
         )
         self.assertEqual(str(scenario), expected_str)
+
+    def test_str_lists_only_public_fields(self):
+        scenario = APIViewTestScenario(expected_response_body='{"id": 1}')
+        scenario.extra = "extra"
+        self.assertEqual(vars(scenario)["extra"], "extra")
+        self.assertEqual(
+            str(scenario),
+            'APIViewTestScenario:\n\texpected_response_body={"id": 1}',
+        )
+
+    def test_parsed_expected_response_body(self):
+        scenario = APIViewTestScenario(expected_response_body='{"id": 1}')
+        self.assertEqual(scenario._expected_response_body_kind, JSON_BODY)
+        self.assertEqual(scenario._parsed_expected_response_body, {"id": 1})
+
+        scenario = APIViewTestScenario(expected_response_body=b"")
+        self.assertEqual(scenario._expected_response_body_kind, RAW_BODY)
+        self.assertEqual(scenario._parsed_expected_response_body, b"")
+
+        scenario = APIViewTestScenario()
+        self.assertEqual(scenario._expected_response_body_kind, NO_BODY)
+
+        scenario = APIViewTestScenario(expected_response_body="not json")
+        self.assertEqual(scenario._expected_response_body_kind, INVALID_JSON_BODY)
+
+    def test_set_expected_response_body(self):
+        scenario = APIViewTestScenario()
+        scenario.expected_response_body = '{"id": 1}'
+        self.assertEqual(scenario.expected_response_body, '{"id": 1}')
+        self.assertEqual(scenario._expected_response_body_kind, JSON_BODY)
+        self.assertEqual(scenario._parsed_expected_response_body, {"id": 1})
+
+        scenario.expected_response_body = b"raw"
+        self.assertEqual(scenario._expected_response_body_kind, RAW_BODY)
+        self.assertEqual(scenario._parsed_expected_response_body, b"raw")
+
+        scenario.expected_response_body = None
+        self.assertEqual(scenario._expected_response_body_kind, NO_BODY)
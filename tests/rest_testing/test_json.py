@@ -0,0 +1,66 @@
+import datetime
+import json
+import math
+import unittest
+import uuid
+from unittest.mock import patch
+
+from rest_testing import _json
+
+
+class JSONTest(unittest.TestCase):
+    def test_dumps(self):
+        for use_orjson in [True, False]:
+            with self.subTest(use_orjson=use_orjson), self._backend(use_orjson):
+                for obj, expected in [
+                    ({"title": "new title"}, {"title": "new title"}),
+                    ({1: "a"}, {"1": "a"}),
+                    ({"n": 2**70}, {"n": 2**70}),
+                    ({"n": None}, {"n": None}),
+                    (
+                        {"id": uuid.UUID("3b13b5f4-150d-494e-8649-ed6e3f58c003")},
+                        {"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003"},
+                    ),
+                ]:
+                    self.assertEqual(json.loads(_json.dumps(obj)), expected)
+
+                for value in [float("nan"), float("inf"), float("-inf")]:
+                    self.assertEqual(
+                        _json.dumps({"n": value}), json.dumps({"n": value})
+                    )
+
+                with self.assertRaises(TypeError):
+                    _json.dumps({"date": datetime.date(2024, 1, 1)})
+
+    def test_loads(self):
+        for use_orjson in [True, False]:
+            with self.subTest(use_orjson=use_orjson), self._backend(use_orjson):
+                self.assertEqual(_json.loads(b'{"id": 1}'), {"id": 1})
+                self.assertEqual(_json.loads('{"id": 1}'), {"id": 1})
+                self.assertEqual(
+                    _json.loads(b'{"n": 123456789012345678901234567890}'),
+                    {"n": 123456789012345678901234567890},
+                )
+                self.assertEqual(
+                    _json.loads('{"n": 123456789012345678901234567890}'),
+                    {"n": 123456789012345678901234567890},
+                )
+                for n in [
+                    -9223372036854775809,
+                    -9999999999999999999,
+                    18446744073709551616,
+                ]:
+                    loaded = _json.loads(f'{{"n": {n}}}'.encode())
+                    self.assertEqual(loaded, {"n": n})
+                    self.assertIsInstance(loaded["n"], int)
+                self.assertTrue(math.isnan(_json.loads(b'{"n": NaN}')["n"]))
+                self.assertEqual(_json.loads(b'{"n": Infinity}'), {"n": math.inf})
+
+                with self.assertRaises(ValueError):
+                    _json.loads(b"not json")
+
+    @staticmethod
+    def _backend(use_orjson):
+        if use_orjson:
+            return patch.object(_json, "orjson", _json.orjson)
+        return patch.object(_json, "orjson", None)
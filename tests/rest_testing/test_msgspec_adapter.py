@@ -0,0 +1,194 @@
+import enum
+import unittest
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import pydantic
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    RootModel,
+    TypeAdapter,
+    field_validator,
+)
+from pydantic_core import core_schema
+from typing_extensions import Annotated
+
+from examples.schemas import DepartmentOut
+from rest_testing import _msgspec_adapter
+
+
+class Level(enum.IntEnum):
+    UNDERGRADUATE = 1
+
+
+class DepartmentWithDefaults(BaseModel):
+    title: str
+    tags: List[str] = Field(default_factory=list)
+    description: Optional[str] = None
+
+
+class DepartmentWithSupportedTypes(BaseModel):
+    kind: Literal["faculty", "school"]
+    level: Optional[Level]
+    codes: Tuple[int, ...]
+    budgets: Dict[str, float]
+    active: bool
+
+
+class DepartmentWithValidator(BaseModel):
+    title: str
+
+    @field_validator("title")
+    @classmethod
+    def validate_title(cls, value: str) -> str:
+        raise ValueError("rejected")
+
+
+class DepartmentWithAlias(BaseModel):
+    title: str = Field(alias="name")
+
+
+class DepartmentWithConstraint(BaseModel):
+    title: str = Field(min_length=1)
+
+
+class StrictDepartment(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+    title: str
+
+
+class DepartmentWithUnion(BaseModel):
+    title: Union[str, bytes]
+
+
+class DepartmentWithSequence(BaseModel):
+    tags: Sequence[str]
+
+
+class DepartmentWithMaxLength(BaseModel):
+    model_config = ConfigDict(str_max_length=3)
+
+    title: str
+
+
+class DepartmentWithPostInit(BaseModel):
+    title: str
+
+    def model_post_init(self, __context: Any) -> None:
+        raise ValueError("rejected")
+
+
+class DepartmentWithCoreSchema(BaseModel):
+    title: str
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return core_schema.no_info_after_validator_function(
+            cls._reject, handler(source)
+        )
+
+    @staticmethod
+    def _reject(value: Any) -> Any:
+        raise ValueError("rejected")
+
+
+class DepartmentWithValidatedDefault(BaseModel):
+    title: str = Field(default=1, validate_default=True)
+
+
+class DepartmentWithIntUnion(BaseModel):
+    level: Union[int, Level]
+
+
+@pydantic.dataclasses.dataclass
+class Head:
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def validate_name(cls, value: str) -> str:
+        raise ValueError("rejected")
+
+
+class DepartmentWithDataclass(BaseModel):
+    head: Head
+
+
+Counts = RootModel[Dict[str, int]]
+
+
+class Faculty(BaseModel):
+    departments: List[DepartmentOut]
+
+
+class MsgspecAdapterTest(unittest.TestCase):
+    def test_is_valid_json(self):
+        self.assertTrue(
+            _msgspec_adapter.is_valid_json(
+                DepartmentOut,
+                b'{"id": "3b13b5f4-150d-494e-8649-ed6e3f58c003", "title": "department-1"}',
+            )
+        )
+        self.assertTrue(
+            _msgspec_adapter.is_valid_json(
+                DepartmentWithDefaults, b'{"title": "department-1"}'
+            )
+        )
+        self.assertFalse(
+            _msgspec_adapter.is_valid_json(
+                DepartmentOut, b'{"id": "invalid", "title": "department-1"}'
+            )
+        )
+        self.assertFalse(_msgspec_adapter.is_valid_json(DepartmentOut, b"not json"))
+        self.assertTrue(
+            _msgspec_adapter.is_valid_json(
+                DepartmentWithSupportedTypes,
+                b'{"kind": "school", "level": 1, "codes": [1, 2], "budgets": {"a": 1.5}, "active": true}',
+            )
+        )
+
+    def test_is_valid_json_without_mirror(self):
+        for type_, data in [
+            (List[DepartmentOut], b'{"title": "x"}'),
+            (DepartmentWithValidator, b'{"title": " x "}'),
+            (DepartmentWithAlias, b'{"title": "x"}'),
+            (DepartmentWithConstraint, b'{"title": ""}'),
+            (StrictDepartment, b'{"title": "x"}'),
+            (DepartmentWithUnion, b'{"title": "x"}'),
+            (DepartmentWithSequence, b'{"tags": []}'),
+            (DepartmentWithMaxLength, b'{"title": "toolong"}'),
+            (DepartmentWithPostInit, b'{"title": "x"}'),
+            (DepartmentWithCoreSchema, b'{"title": "x"}'),
+            (DepartmentWithValidatedDefault, b"{}"),
+            (DepartmentWithIntUnion, b'{"level": 1}'),
+            (DepartmentWithDataclass, b'{"head": {"name": "x"}}'),
+            (Faculty, b'{"departments": []}'),
+            (Counts, b'{"root": {"a": 1}}'),
+        ]:
+            with self.subTest(type_=type_):
+                self.assertIsNone(_msgspec_adapter._get_decoder(type_))
+                self.assertFalse(_msgspec_adapter.is_valid_json(type_, data))
+
+    def test_is_valid_json_unhashable_type(self):
+        self.assertFalse(
+            _msgspec_adapter.is_valid_json(
+                Annotated[List[int], {"doc": "ids"}], b"[1, 2]"
+            )
+        )
+
+    def test_is_valid_json_never_accepts_what_pydantic_rejects(self):
+        for type_, data in [
+            (DepartmentWithValidator, b'{"title": "x"}'),
+            (DepartmentWithMaxLength, b'{"title": "toolong"}'),
+            (DepartmentWithPostInit, b'{"title": "x"}'),
+            (DepartmentWithCoreSchema, b'{"title": "x"}'),
+            (DepartmentWithValidatedDefault, b"{}"),
+            (DepartmentWithDataclass, b'{"head": {"name": "x"}}'),
+            (Counts, b'{"root": {"a": 1}}'),
+        ]:
+            with self.subTest(type_=type_):
+                with self.assertRaises(ValueError):
+                    TypeAdapter(type_).validate_json(data)
+                self.assertFalse(_msgspec_adapter.is_valid_json(type_, data))